@@ -1,11 +1,23 @@
 """Serializers for recipe app"""
 
+import copy
+
 from rest_framework import serializers
 
 from core.models import Recipe, Tag, Ingredient
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Cache the computed serializer field map once per class"""
+
+    def get_fields(self):
+        cls = self.__class__
+        if '_cached_fields' not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return copy.deepcopy(cls._cached_fields)
+
+
+class IngredientSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for ingredient objects"""
 
     class Meta:
@@ -14,7 +26,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for tag objects"""
 
     class Meta:
@@ -23,7 +35,7 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class RecipeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for recipe objects"""
     tags = TagSerializer(many=True, required=False, )
     ingredients = IngredientSerializer(many=True, required=False, )
@@ -39,22 +51,38 @@ class RecipeSerializer(serializers.ModelSerializer):
     def _get_or_create_tags(self, tags, recipe):
         """Get or create tags"""
         auth_user = self.context['request'].user
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag
-            )
-            recipe.tags.add(tag_obj)
+        names = [tag['name'] for tag in tags]
+        existing = set(
+            Tag.objects.filter(
+                user=auth_user, name__in=names
+            ).values_list('name', flat=True)
+        )
+        Tag.objects.bulk_create(
+            [Tag(user=auth_user, name=name)
+             for name in set(names) - existing],
+            ignore_conflicts=True,
+        )
+        recipe.tags.add(
+            *Tag.objects.filter(user=auth_user, name__in=names)
+        )
 
     def _get_or_create_ingredients(self, ingredients, recipe):
         """Get or create ingredients"""
         auth_user = self.context['request'].user
-        for ingredient in ingredients:
-            ingredient_obj, created = Ingredient.objects.get_or_create(
-                user=auth_user,
-                **ingredient
-            )
-            recipe.ingredients.add(ingredient_obj)
+        names = [ingredient['name'] for ingredient in ingredients]
+        existing = set(
+            Ingredient.objects.filter(
+                user=auth_user, name__in=names
+            ).values_list('name', flat=True)
+        )
+        Ingredient.objects.bulk_create(
+            [Ingredient(user=auth_user, name=name)
+             for name in set(names) - existing],
+            ignore_conflicts=True,
+        )
+        recipe.ingredients.add(
+            *Ingredient.objects.filter(user=auth_user, name__in=names)
+        )
 
     def create(self, validated_data):
         """Create a new recipe"""
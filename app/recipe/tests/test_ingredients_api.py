@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -28,8 +28,11 @@ def create_user(email='user@example.com', password='test123'):
     return get_user_model().objects.create_user(email, password)
 
 
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(SimpleTestCase):
     """Test the publicly available ingredients API."""
+    # No DB access: the request is rejected before any query runs, so
+    # skip the per-test transaction setup entirely.
+    databases = set()
 
     def setUp(self):
         self.client = APIClient()
@@ -44,10 +47,14 @@ class PublicIngredientsApiTests(TestCase):
 class PrivateIngredientsApiTests(TestCase):
     """Test the private ingredients API."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.client_shared = APIClient()
+        cls.client_shared.force_authenticate(cls.user)
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
-        self.client.force_authenticate(self.user)
+        self.client = self.client_shared
 
     def test_retrieve_ingredients_list(self):
         """Test retrieving a list of ingredients."""
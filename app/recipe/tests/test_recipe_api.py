@@ -7,7 +7,7 @@ import tempfile
 from PIL import Image
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -22,28 +22,42 @@ from recipe.serializers import (
 
 RECIPES_URL = reverse('recipe:recipe-list')
 
+# Shared constants: Decimal parses its argument on every construction
+# and the default payload dict is identical across tests, so build them
+# once at import time.
+D_5 = Decimal('5.00')
+D_7 = Decimal('7.00')
+D_20 = Decimal('20.00')
+
+DEFAULTS = {
+    'title': 'Sample recipe',
+    'time_minutes': 10,
+    'price': D_5,
+    'description': 'Sample description',
+    'link': 'https://www.google.com'
+}
+
+# Resolve the parameterized URLs once at import time; reverse() walks
+# the URL resolver on every call, which adds up across the suite.
+DETAIL_URL_TEMPLATE = reverse(
+    'recipe:recipe-detail', args=[0]).replace('/0/', '/{}/')
+IMAGE_UPLOAD_URL_TEMPLATE = reverse(
+    'recipe:recipe-upload-image', args=[0]).replace('/0/', '/{}/')
+
 
 def detail_url(recipe_id):
     """Return recipe detail URL"""
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+    return DETAIL_URL_TEMPLATE.format(recipe_id)
 
 
 def image_upload_url(recipe_id):
     """Return URL for recipe image upload"""
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+    return IMAGE_UPLOAD_URL_TEMPLATE.format(recipe_id)
 
 
 def create_recipe(user, **params):
     """Helper function to create a recipe"""
-    defaults = {
-        'title': 'Sample recipe',
-        'time_minutes': 10,
-        'price': Decimal('5.00'),
-        'description': 'Sample description',
-        'link': 'https://www.google.com'
-    }
-    defaults.update(params)
-    return Recipe.objects.create(user=user, **defaults)
+    return Recipe.objects.create(user=user, **{**DEFAULTS, **params})
 
 
 def create_user(**params):
@@ -51,8 +65,11 @@ def create_user(**params):
     return get_user_model().objects.create_user(**params)
 
 
-class PublicRecipeApiTests(TestCase):
+class PublicRecipeApiTests(SimpleTestCase):
     """Test unauthenticated recipe API access"""
+    # No DB access: the request is rejected before any query runs, so
+    # skip the per-test transaction setup entirely.
+    databases = set()
 
     def setUp(self):
         self.client = APIClient()
@@ -67,25 +84,36 @@ class PublicRecipeApiTests(TestCase):
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access"""
 
-    def setUp(self):
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='test@example.com',
             password='testpass',
         )
-        self.client = APIClient()
-        self.client.force_authenticate(self.user)
+        cls.client_shared = APIClient()
+        cls.client_shared.force_authenticate(cls.user)
+
+    def setUp(self):
+        self.client = self.client_shared
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes"""
         create_recipe(user=self.user)
         create_recipe(user=self.user)
 
-        response = self.client.get(RECIPES_URL)
+        # One SELECT for the recipes plus one prefetch each for tags and
+        # ingredients; guards against reintroducing N+1 queries.
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPES_URL)
 
+        # Compare ids rather than re-serializing; the full payload shape
+        # is covered by test_recipe_limited_to_user.
         recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(
+            [item['id'] for item in response.data],
+            [recipe.id for recipe in recipes],
+        )
 
     def test_recipe_limited_to_user(self):
         """Test retrieving recipes for user"""
@@ -110,7 +138,10 @@ class PrivateRecipeApiTests(TestCase):
         recipe = create_recipe(user=self.user)
 
         url = detail_url(recipe.id)
-        response = self.client.get(url)
+        # One SELECT for the recipe plus one prefetch each for tags and
+        # ingredients; guards against reintroducing N+1 queries.
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
 
         serializer = RecipeDetailSerializer(recipe)
         self.assertEqual(response.data, serializer.data)
@@ -161,7 +192,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'New Spaghetti carbonara',
             'time_minutes': 25,
-            'price': Decimal('7.00'),
+            'price': D_7,
             'link': 'https://www.yahoo.com',
             'description': 'New Sample description',
         }
@@ -224,21 +255,20 @@ class PrivateRecipeApiTests(TestCase):
             'title': 'Avocado lime cheesecake',
             'tags': [{'name': 'vegan'}, {'name': 'dessert'}],
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': D_20,
         }
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
+        recipes = list(Recipe.objects.filter(user=self.user))
+        self.assertEqual(len(recipes), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
+        tag_names = set(
+            recipe.tags.filter(user=self.user).values_list('name', flat=True)
+        )
         for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+            self.assertIn(tag['name'], tag_names)
 
     def test_create_recipe_with_existing_tag(self):
         """Test creating a recipe with existing tag"""
@@ -247,22 +277,21 @@ class PrivateRecipeApiTests(TestCase):
             'title': 'Avocado lime cheesecake',
             'tags': [{'name': tag.name}, {'name': 'dessert'}],
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': D_20,
         }
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
+        recipes = list(Recipe.objects.filter(user=self.user))
+        self.assertEqual(len(recipes), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
         self.assertIn(tag, recipe.tags.all())
+        tag_names = set(
+            recipe.tags.filter(user=self.user).values_list('name', flat=True)
+        )
         for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+            self.assertIn(tag['name'], tag_names)
 
     def test_create_tag_on_update(self):
         """Test creating a tag on update"""
@@ -271,7 +300,7 @@ class PrivateRecipeApiTests(TestCase):
             'title': 'Avocado lime cheesecake',
             'tags': [{'name': 'dessert'}],
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': D_20,
         }
 
         url = detail_url(recipe.id)
@@ -323,20 +352,21 @@ class PrivateRecipeApiTests(TestCase):
                 {'name': 'red curry paste'},
             ],
             'time_minutes': 20,
-            'price': Decimal('7.00'),
+            'price': D_7,
         }
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
+        recipes = list(Recipe.objects.filter(user=self.user))
         recipe = recipes[0]
         self.assertEqual(recipe.ingredients.count(), 3)
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
+        ingredient_names = set(
+            recipe.ingredients.filter(
                 user=self.user
-            ).exists()
-            self.assertTrue(exists)
+            ).values_list('name', flat=True)
+        )
+        for ingredient in payload['ingredients']:
+            self.assertIn(ingredient['name'], ingredient_names)
 
     def test_create_recipe_with_existing_ingredients(self):
         """Test creating recipe with existing ingredients"""
@@ -350,22 +380,23 @@ class PrivateRecipeApiTests(TestCase):
                 {'name': 'red curry paste'},
             ],
             'time_minutes': 20,
-            'price': Decimal('7.00'),
+            'price': D_7,
         }
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
+        recipes = list(Recipe.objects.filter(user=self.user))
+        self.assertEqual(len(recipes), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.ingredients.count(), 3)
         self.assertIn(ingredient, recipe.ingredients.all())
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
+        ingredient_names = set(
+            recipe.ingredients.filter(
                 user=self.user
-            ).exists()
-            self.assertTrue(exists)
+            ).values_list('name', flat=True)
+        )
+        for ingredient in payload['ingredients']:
+            self.assertIn(ingredient['name'], ingredient_names)
 
     def test_create_ingredients_on_updated(self):
         """Test creating ingredients on update"""
@@ -5,7 +5,7 @@ Tests for tags API
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -27,8 +27,11 @@ def create_user(email='user@example.com', password='test123'):
     return get_user_model().objects.create_user(email, password)
 
 
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(SimpleTestCase):
     """Test the publicly available tags API."""
+    # No DB access: the request is rejected before any query runs, so
+    # skip the per-test transaction setup entirely.
+    databases = set()
 
     def setUp(self):
         self.client = APIClient()
@@ -43,10 +46,14 @@ class PublicTagsApiTests(TestCase):
 class PrivateTagsApiTests(TestCase):
     """Test the authorized user tags API."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.client_shared = APIClient()
+        cls.client_shared.force_authenticate(cls.user)
+
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
-        self.client.force_authenticate(self.user)
+        self.client = self.client_shared
 
     def test_retrieve_tags(self):
         """Test retrieving tags."""
@@ -9,6 +9,8 @@ from drf_spectacular.utils import (
     OpenApiTypes,
 )
 
+from django.db.models import prefetch_related_objects
+
 from rest_framework import viewsets, mixins, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -58,9 +60,26 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
 
-        return queryset.filter(
+        queryset = queryset.filter(
             user=self.request.user
-        ).order_by('-id').distinct()
+        ).order_by('-id').distinct().select_related(
+            'user'
+        ).prefetch_related('tags', 'ingredients')
+        if self.action == 'list':
+            # The list serializer exposes only a subset of columns, so
+            # skip loading description and image. 'user' stays in the
+            # list to keep the select_related join valid.
+            queryset = queryset.only(
+                'id', 'title', 'time_minutes', 'price', 'link', 'user',
+            )
+
+        return queryset
+
+    def get_object(self):
+        """Return the recipe with its relations prefetched"""
+        obj = super().get_object()
+        prefetch_related_objects([obj, ], 'tags', 'ingredients')
+        return obj
 
     def get_serializer_class(self):
         """Return appropriate serializer class"""
@@ -0,0 +1,36 @@
+"""
+Authentication classes for the user API.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication that caches the token-to-user-id lookup
+
+    Only the user id is cached; the user row is re-read on every
+    request, so profile updates are visible immediately and a
+    deactivated user is rejected even while its token is cached.
+    """
+    cache_timeout = 60
+
+    def authenticate_credentials(self, key):
+        cache_key = f'auth-token:{key}'
+        user_id = cache.get(cache_key)
+        if user_id is None:
+            user, token = super().authenticate_credentials(key)
+            cache.set(cache_key, user.pk, self.cache_timeout)
+            return (user, token)
+
+        user = get_user_model().objects.filter(pk=user_id).first()
+        if user is None or not user.is_active:
+            cache.delete(cache_key)
+            raise exceptions.AuthenticationFailed(
+                _('User inactive or deleted.'))
+
+        return (user, key)
@@ -1,10 +1,12 @@
 """Test the users API
 """
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from rest_framework import status
 
@@ -189,3 +191,69 @@ class PrivateUserApiTests(TestCase):
         self.assertEqual(self.user.name, payload['name'])
         self.assertTrue(self.user.check_password(payload['password']))
         self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Test the me endpoint with real token credentials
+    """
+
+    def setUp(self):
+        self.user = create_user(
+            email='test@example.com',
+            password='testpass',
+            name='Test name'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def tearDown(self):
+        # The token cache lives outside the test transaction, so clear
+        # it to keep tests independent.
+        cache.clear()
+
+    def test_token_authentication_success(self):
+        """Test retrieving the profile with a token succeeds
+        """
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, {
+            'name': self.user.name,
+            'email': self.user.email
+        })
+
+    def test_invalid_token_rejected(self):
+        """Test that an invalid token is rejected
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token invalidtoken')
+
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_update_visible_after_cached_auth(self):
+        """Test that a profile update is visible on the next request
+        """
+        # Warm the token cache, then update and read back.
+        self.client.get(ME_URL)
+        payload = {'name': 'Updated Name'}
+
+        res = self.client.patch(ME_URL, payload)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(ME_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['name'], payload['name'])
+
+    def test_inactive_user_rejected_while_cached(self):
+        """Test that a deactivated user is rejected despite the cache
+        """
+        self.client.get(ME_URL)
+        self.user.is_active = False
+        self.user.save()
+
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
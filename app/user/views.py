@@ -2,10 +2,11 @@
 Views for the user API.
 """
 
-from rest_framework import generics, authentication, permissions
+from rest_framework import generics, permissions
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.settings import api_settings
 
+from user.authentication import CachedTokenAuthentication
 from user.serializers import (
     UserSerializer,
     AuthTokenSerializer,
@@ -20,8 +21,8 @@ class CreateUserView(generics.CreateAPIView):
 class ManageUserView(generics.RetrieveUpdateAPIView):
     """Manage the authenticated user"""
     serializer_class = UserSerializer
-    # Set authentication classes to be able to view in browser
-    authentication_classes = [authentication.TokenAuthentication, ]
+    # Cache the token lookup to avoid one SELECT per authenticated request
+    authentication_classes = [CachedTokenAuthentication, ]
     # Set permission classes to be able to view in browser
     permission_classes = [permissions.IsAuthenticated, ]
 